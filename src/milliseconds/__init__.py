@@ -1,4 +1,68 @@
-from .milliseconds import milliseconds
-from .constants import constants
+from .milliseconds import (
+    milliseconds,
+    time,
+    floor,
+    ceil,
+    last_second,
+    next_second,
+    last_minute,
+    next_minute,
+    last_hour,
+    next_hour,
+    last_day,
+    next_day,
+    is_valid_second,
+    is_valid_minute,
+    is_valid_hour,
+    is_valid_day,
+    increment_second,
+    decrement_second,
+    increment_minute,
+    decrement_minute,
+    increment_hour,
+    decrement_hour,
+    increment_day,
+    decrement_day,
+    is_same_second,
+    is_same_minute,
+    is_same_hour,
+    is_same_day,
+)
+from .constants import DAY, HOUR, MINUTE, SECOND, UTC, constants
 
-__all__ = ["milliseconds", "constants"]
+__all__ = [
+    "milliseconds",
+    "constants",
+    "SECOND",
+    "MINUTE",
+    "HOUR",
+    "DAY",
+    "UTC",
+    "time",
+    "floor",
+    "ceil",
+    "last_second",
+    "next_second",
+    "last_minute",
+    "next_minute",
+    "last_hour",
+    "next_hour",
+    "last_day",
+    "next_day",
+    "is_valid_second",
+    "is_valid_minute",
+    "is_valid_hour",
+    "is_valid_day",
+    "increment_second",
+    "decrement_second",
+    "increment_minute",
+    "decrement_minute",
+    "increment_hour",
+    "decrement_hour",
+    "increment_day",
+    "decrement_day",
+    "is_same_second",
+    "is_same_minute",
+    "is_same_hour",
+    "is_same_day",
+]
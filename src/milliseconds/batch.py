@@ -0,0 +1,289 @@
+"""
+Vectorized operations on NumPy arrays of timestamps in milliseconds.
+
+This module mirrors the scalar helpers of the milliseconds class for whole
+arrays at once, so that processing a stream of timestamps costs one C-level
+loop per operation instead of one interpreter round-trip per element.
+
+NumPy is an optional dependency and is only required by this module:
+    pip install milliseconds[numpy]
+
+All functions expect arrays of dtype int64. Other inputs are converted with
+np.asarray(..., dtype=np.int64); large millisecond values kept in Python
+lists or object arrays would otherwise make NumPy fall back to slow
+element-wise Python arithmetic.
+"""
+
+import numpy as np
+
+from .constants import DAY, HOUR, MINUTE, SECOND
+
+# NumPy replaces integer floor division by a scalar with a multiply (libdivide), but
+# computes np.mod with a real division. ceil_batch and the is_valid_*_batch functions
+# are therefore built on floor division instead of the remainder.
+
+
+def time_batch(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Convert timestamps in milliseconds to NumPy datetime64[ms] values.
+
+    NumPy datetimes carry no timezone; the values are UTC wall-clock times, the
+    same instants milliseconds.time returns for ZoneInfo("UTC").
+
+    Args:
+        timestamps: Array of timestamps in milliseconds (int64)
+
+    Returns:
+        New datetime64[ms] array
+
+    Example:
+        >>> time_batch(np.array([1704110400500, -3600000]))
+        array(['2024-01-01T12:00:00.500', '1969-12-31T23:00:00.000'],
+              dtype='datetime64[ms]')
+    """
+    return np.asarray(timestamps, dtype=np.int64).astype("datetime64[ms]")
+
+
+def milliseconds_batch(datetimes: np.ndarray) -> np.ndarray:
+    """
+    Convert NumPy datetime64 values to timestamps in milliseconds.
+
+    This is the inverse of time_batch. The values are read as UTC wall-clock
+    times. Inputs with a finer unit than milliseconds are rounded down, the
+    same way milliseconds.milliseconds drops sub-millisecond precision. NaT
+    becomes the smallest int64 value.
+
+    Args:
+        datetimes: Array of datetime64 values in any unit
+
+    Returns:
+        New int64 array of timestamps in milliseconds
+
+    Example:
+        >>> milliseconds_batch(
+        ...     np.array(['2024-01-01T12:00:00.500', '1969-12-31T23:00'],
+        ...              dtype='datetime64[ms]')
+        ... )
+        array([1704110400500,      -3600000])
+    """
+    return np.array(datetimes, dtype="datetime64[ms]").view(np.int64)
+
+
+def floor_batch(timestamps: np.ndarray, factor: int = HOUR) -> np.ndarray:
+    """
+    Round down every timestamp to the nearest multiple of a time factor.
+
+    Negative timestamps (dates before Unix epoch) are handled the same way as
+    milliseconds.floor, rounding toward negative infinity.
+
+    Args:
+        timestamps: Array of timestamps in milliseconds (int64)
+        factor: Time unit to floor to (default: constants.hour)
+
+    Returns:
+        New int64 array of floored timestamps in milliseconds
+
+    Example:
+        >>> floor_batch(np.array([1704110455000, -50000]), constants.minute)
+        array([1704110400000,        -60000])
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    result = np.floor_divide(timestamps, factor)
+    return np.multiply(result, factor, out=result)
+
+
+def ceil_batch(timestamps: np.ndarray, factor: int = HOUR) -> np.ndarray:
+    """
+    Round up every timestamp to the nearest multiple of a time factor.
+
+    Negative timestamps (dates before Unix epoch) are handled the same way as
+    milliseconds.ceil, rounding toward positive infinity.
+
+    Args:
+        timestamps: Array of timestamps in milliseconds (int64)
+        factor: Time unit to ceil to (default: constants.hour)
+
+    Returns:
+        New int64 array of ceiled timestamps in milliseconds
+
+    Example:
+        >>> ceil_batch(np.array([1704110455000, -50000]), constants.minute)
+        array([1704110460000,             0])
+    """
+    # ceil(ts) == -floor(-ts), folded into a multiply by -factor
+    result = np.negative(np.asarray(timestamps, dtype=np.int64))
+    np.floor_divide(result, factor, out=result)
+    return np.multiply(result, -factor, out=result)
+
+
+def is_valid_second_batch(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Check which timestamps are aligned to a second boundary.
+
+    Args:
+        timestamps: Array of timestamps in milliseconds (int64)
+
+    Returns:
+        Boolean array, True where the timestamp has no millisecond component
+
+    Example:
+        >>> is_valid_second_batch(np.array([1704110455000, 1704110455500]))
+        array([ True, False])
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    return floor_batch(timestamps, SECOND) == timestamps
+
+
+def is_valid_minute_batch(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Check which timestamps are aligned to a minute boundary.
+
+    Args:
+        timestamps: Array of timestamps in milliseconds (int64)
+
+    Returns:
+        Boolean array, True where the timestamp has no second or millisecond
+        component
+
+    Example:
+        >>> is_valid_minute_batch(np.array([1704110400000, 1704110455000]))
+        array([ True, False])
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    return floor_batch(timestamps, MINUTE) == timestamps
+
+
+def is_valid_hour_batch(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Check which timestamps are aligned to an hour boundary.
+
+    Args:
+        timestamps: Array of timestamps in milliseconds (int64)
+
+    Returns:
+        Boolean array, True where the timestamp has no minute, second, or
+        millisecond component
+
+    Example:
+        >>> is_valid_hour_batch(np.array([1704110400000, 1704110455000]))
+        array([ True, False])
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    return floor_batch(timestamps, HOUR) == timestamps
+
+
+def is_valid_day_batch(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Check which timestamps are aligned to a day boundary (UTC).
+
+    Args:
+        timestamps: Array of timestamps in milliseconds (int64)
+
+    Returns:
+        Boolean array, True where the timestamp represents midnight UTC
+
+    Example:
+        >>> is_valid_day_batch(np.array([1704067200000, 1704110455000]))
+        array([ True, False])
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    return floor_batch(timestamps, DAY) == timestamps
+
+
+def is_same_second_batch(ts1: np.ndarray, ts2: np.ndarray) -> np.ndarray:
+    """
+    Check element-wise if two timestamp arrays fall within the same second.
+
+    Args:
+        ts1: First array of timestamps in milliseconds (int64)
+        ts2: Second array of timestamps in milliseconds (int64), broadcastable
+            against ts1
+
+    Returns:
+        Boolean array, True where both timestamps are in the same second
+
+    Example:
+        >>> is_same_second_batch(
+        ...     np.array([1704110455100, 1704110455900]),
+        ...     np.array([1704110455900, 1704110456100]),
+        ... )
+        array([ True, False])
+    """
+    ts1 = np.asarray(ts1, dtype=np.int64)
+    ts2 = np.asarray(ts2, dtype=np.int64)
+    return np.floor_divide(ts1, SECOND) == np.floor_divide(ts2, SECOND)
+
+
+def is_same_minute_batch(ts1: np.ndarray, ts2: np.ndarray) -> np.ndarray:
+    """
+    Check element-wise if two timestamp arrays fall within the same minute.
+
+    Args:
+        ts1: First array of timestamps in milliseconds (int64)
+        ts2: Second array of timestamps in milliseconds (int64), broadcastable
+            against ts1
+
+    Returns:
+        Boolean array, True where both timestamps are in the same minute
+
+    Example:
+        >>> is_same_minute_batch(
+        ...     np.array([1704110400000, 1704110459000]),
+        ...     np.array([1704110459000, 1704110460000]),
+        ... )
+        array([ True, False])
+    """
+    ts1 = np.asarray(ts1, dtype=np.int64)
+    ts2 = np.asarray(ts2, dtype=np.int64)
+    return np.floor_divide(ts1, MINUTE) == np.floor_divide(ts2, MINUTE)
+
+
+def is_same_hour_batch(ts1: np.ndarray, ts2: np.ndarray) -> np.ndarray:
+    """
+    Check element-wise if two timestamp arrays fall within the same hour.
+
+    Args:
+        ts1: First array of timestamps in milliseconds (int64)
+        ts2: Second array of timestamps in milliseconds (int64), broadcastable
+            against ts1
+
+    Returns:
+        Boolean array, True where both timestamps are in the same hour
+
+    Example:
+        >>> is_same_hour_batch(
+        ...     np.array([1704110400000, 1704113999000]),
+        ...     np.array([1704113999000, 1704114000000]),
+        ... )
+        array([ True, False])
+    """
+    ts1 = np.asarray(ts1, dtype=np.int64)
+    ts2 = np.asarray(ts2, dtype=np.int64)
+    return np.floor_divide(ts1, HOUR) == np.floor_divide(ts2, HOUR)
+
+
+def is_same_day_batch(ts1: np.ndarray, ts2: np.ndarray) -> np.ndarray:
+    """
+    Check element-wise if two timestamp arrays fall within the same day (UTC).
+
+    Note: This compares UTC day boundaries. For timezone-aware comparisons,
+    shift the timestamps by the target timezone's UTC offset first.
+
+    Args:
+        ts1: First array of timestamps in milliseconds (int64)
+        ts2: Second array of timestamps in milliseconds (int64), broadcastable
+            against ts1
+
+    Returns:
+        Boolean array, True where both timestamps are on the same UTC day
+
+    Example:
+        >>> is_same_day_batch(
+        ...     np.array([1704067200000, 1704153599000]),
+        ...     np.array([1704153599000, 1704153600000]),
+        ... )
+        array([ True, False])
+    """
+    ts1 = np.asarray(ts1, dtype=np.int64)
+    ts2 = np.asarray(ts2, dtype=np.int64)
+    return np.floor_divide(ts1, DAY) == np.floor_divide(ts2, DAY)
@@ -2,11 +2,29 @@
 Time unit constants in milliseconds.
 
 This module provides an IntEnum of time unit constants for working with
-millisecond timestamps. All values represent the number of milliseconds
-in each respective time unit.
+millisecond timestamps, and the same values as plain int constants. All
+values represent the number of milliseconds in each respective time unit.
+It also provides a shared UTC timezone object.
+
+At package level the name constants refers to the IntEnum, which shadows this
+module, so the plain constants and UTC are public as milliseconds.SECOND, ...,
+milliseconds.UTC rather than as constants.UTC.
 """
 
 from enum import IntEnum
+from typing import Final
+from zoneinfo import ZoneInfo
+
+# Plain int versions of the time units for hot paths and default arguments.
+# Arithmetic on IntEnum members dispatches through the enum class on every call.
+# Final lets mypyc read them from C statics instead of the module dict.
+SECOND: Final = 1_000
+MINUTE: Final = 60_000
+HOUR: Final = 3_600_000
+DAY: Final = 86_400_000
+
+# Built once at import; pass it instead of calling ZoneInfo("UTC") per conversion.
+UTC = ZoneInfo("UTC")
 
 
 class constants(IntEnum):
@@ -33,13 +51,13 @@ class constants(IntEnum):
     """
 
     """Milliseconds in one second (1,000)"""
-    second = 1_000
+    second = SECOND
 
     """Milliseconds in one minute (60,000)"""
-    minute = 60_000
+    minute = MINUTE
 
     """Milliseconds in one hour (3,600,000)"""
-    hour = 3_600_000
+    hour = HOUR
 
     """Milliseconds in one day (86,400,000)"""
-    day = 86_400_000
+    day = DAY
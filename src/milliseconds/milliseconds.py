@@ -1,591 +1,680 @@
 """
-Utility class for working with POSIX timestamps in milliseconds.
+Utility functions for working with POSIX timestamps in milliseconds.
 
-This module provides methods for converting between datetime objects and millisecond
+This module provides functions for converting between datetime objects and millisecond
 timestamps, as well as various time manipulation operations. All operations work with
 POSIX time (milliseconds since Unix epoch: 1970-01-01 00:00:00 UTC).
 
+Every function is also available as a static method of the milliseconds class, which
+namespaces the whole API under a single import.
+
 Constants are imported from the constants module:
-    constants.second: Milliseconds in one second (1,000)
-    constants.minute: Milliseconds in one minute (60,000)
-    constants.hour: Milliseconds in one hour (3,600,000)
-    constants.day: Milliseconds in one day (86,400,000)
+    SECOND (constants.second): Milliseconds in one second (1,000)
+    MINUTE (constants.minute): Milliseconds in one minute (60,000)
+    HOUR (constants.hour): Milliseconds in one hour (3,600,000)
+    DAY (constants.day): Milliseconds in one day (86,400,000)
+    UTC: Shared ZoneInfo("UTC") object, the default timezone of time()
 """
 
 from datetime import datetime
+from typing import ClassVar, Final, Union
 from zoneinfo import ZoneInfo
 
-from .constants import constants
+from .constants import DAY, HOUR, MINUTE, SECOND, UTC
 
+_EPOCH_UTC: Final = datetime(1970, 1, 1, tzinfo=UTC)
 
-class milliseconds:
+# Below 2**32 seconds (year 2106) a double resolves better than half a microsecond,
+# so milliseconds / 1000 still rounds to the exact millisecond in fromtimestamp().
+_FLOAT_EXACT_LIMIT: Final = 2**32 * 1000
+
+
+def time(milliseconds: int, timezone: ZoneInfo = UTC) -> datetime:
     """
-    A utility class for working with POSIX timestamps in milliseconds.
+    Convert milliseconds since Unix epoch to a datetime object.
 
-    All methods are static and operate on integer timestamps representing
-    milliseconds since the Unix epoch (1970-01-01 00:00:00 UTC).
+    The result is exact to the millisecond over the whole datetime range.
+
+    Args:
+        milliseconds: Integer milliseconds since Unix epoch
+        timezone: ZoneInfo object specifying the target timezone (default: UTC).
+            When converting many timestamps, build the ZoneInfo once and reuse
+            it rather than calling ZoneInfo(...) for every conversion.
+
+    Returns:
+        Timezone-aware datetime object
+
+    Example:
+        >>> ms = 1704110400000
+        >>> milliseconds.time(ms)
+        datetime.datetime(2024, 1, 1, 12, 0, tzinfo=zoneinfo.ZoneInfo(key='UTC'))
     """
+    if abs(milliseconds) < _FLOAT_EXACT_LIMIT:
+        return datetime.fromtimestamp(milliseconds / 1000, timezone)
+    seconds, remainder = divmod(milliseconds, 1000)
+    return datetime.fromtimestamp(seconds, timezone).replace(
+        microsecond=remainder * 1000
+    )
 
-    @staticmethod
-    def milliseconds(time: datetime) -> int:
-        """
-        Convert a datetime object to milliseconds since Unix epoch.
 
-        Args:
-            time: A datetime object (timezone-aware or naive)
+def floor(milliseconds: int, factor: int = HOUR) -> int:
+    """
+    Round down a timestamp to the nearest multiple of a time factor.
 
-        Returns:
-            Integer milliseconds since Unix epoch
+    This method correctly handles negative timestamps (dates before Unix epoch).
+    Python's modulo takes the sign of the divisor, so subtracting the remainder
+    always rounds toward negative infinity.
 
-        Example:
-            >>> dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=ZoneInfo("UTC"))
-            >>> milliseconds.milliseconds(dt)
-            1704110400000
-        """
-        return int(time.timestamp() * 1000)
+    Args:
+        milliseconds: Timestamp in milliseconds
+        factor: Time unit to floor to (default: constants.hour)
 
-    @staticmethod
-    def time(milliseconds: int, timezone: ZoneInfo) -> datetime:
-        """
-        Convert milliseconds since Unix epoch to a datetime object.
+    Returns:
+        Floored timestamp in milliseconds
 
-        Args:
-            milliseconds: Integer milliseconds since Unix epoch
-            timezone: ZoneInfo object specifying the target timezone
+    Example:
+        >>> milliseconds.floor(1704110455000, constants.day)  # 2024-01-01 12:00:55
+        1704067200000  # 2024-01-01 00:00:00
+        >>> milliseconds.floor(-50000, constants.minute)  # 1969-12-31 23:59:10
+        -60000  # 1969-12-31 23:59:00
+    """
+    return milliseconds - milliseconds % factor
 
-        Returns:
-            Timezone-aware datetime object
 
-        Example:
-            >>> ms = 1704110400000
-            >>> milliseconds.time(ms, ZoneInfo("UTC"))
-            datetime.datetime(2024, 1, 1, 12, 0, tzinfo=zoneinfo.ZoneInfo(key='UTC'))
-        """
-        return datetime.fromtimestamp(milliseconds / 1000, timezone)
+def ceil(milliseconds: int, factor: int = HOUR) -> int:
+    """
+    Round up a timestamp to the nearest multiple of a time factor.
 
-    @staticmethod
-    def floor(milliseconds: int, factor: int = constants.hour) -> int:
-        """
-        Round down a timestamp to the nearest multiple of a time factor.
+    This method correctly handles negative timestamps (dates before Unix epoch).
+    For negative numbers, ceiling rounds toward zero (less negative).
 
-        This method correctly handles negative timestamps (dates before Unix epoch).
-        Python's floor division automatically rounds toward negative infinity.
+    Args:
+        milliseconds: Timestamp in milliseconds
+        factor: Time unit to ceil to (default: constants.hour)
 
-        Args:
-            milliseconds: Timestamp in milliseconds
-            factor: Time unit to floor to (default: constants.hour)
+    Returns:
+        Ceiled timestamp in milliseconds
 
-        Returns:
-            Floored timestamp in milliseconds
+    Example:
+        >>> milliseconds.ceil(1704110455000, constants.hour)  # 2024-01-01 12:00:55
+        1704114000000  # 2024-01-01 13:00:00
+        >>> milliseconds.ceil(-50000, constants.minute)  # 1969-12-31 23:59:10
+        0  # 1970-01-01 00:00:00
+    """
+    # (-ms) % factor is the distance up to the next multiple (0 if aligned),
+    # for both signs, so no branch on the sign or the alignment is needed.
+    return milliseconds + (-milliseconds) % factor
 
-        Example:
-            >>> milliseconds.floor(1704110455000, constants.day)  # 2024-01-01 12:00:55
-            1704067200000  # 2024-01-01 00:00:00
-            >>> milliseconds.floor(-50000, constants.minute)  # 1969-12-31 23:59:10
-            -60000  # 1969-12-31 23:59:00
-        """
-        return (milliseconds // factor) * factor
 
-    @staticmethod
-    def ceil(milliseconds: int, factor: int = constants.hour) -> int:
-        """
-        Round up a timestamp to the nearest multiple of a time factor.
+def last_second(timestamp: int) -> int:
+    """
+    Get the start of the previous second.
 
-        This method correctly handles negative timestamps (dates before Unix epoch).
-        For negative numbers, ceiling rounds toward zero (less negative).
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Args:
-            milliseconds: Timestamp in milliseconds
-            factor: Time unit to ceil to (default: constants.hour)
+    Returns:
+        Timestamp of the previous second boundary
 
-        Returns:
-            Ceiled timestamp in milliseconds
+    Example:
+        >>> milliseconds.last_second(1704110455500)  # 12:00:55.500
+        1704110454000  # 12:00:54.000
+        >>> milliseconds.last_second(500)  # 1970-01-01 00:00:00.500
+        0  # 1970-01-01 00:00:00.000
+        >>> milliseconds.last_second(0)  # 1970-01-01 00:00:00.000
+        -1000  # 1969-12-31 23:59:59.000
+    """
+    return timestamp - timestamp % SECOND - SECOND
 
-        Example:
-            >>> milliseconds.ceil(1704110455000, constants.hour)  # 2024-01-01 12:00:55
-            1704114000000  # 2024-01-01 13:00:00
-            >>> milliseconds.ceil(-50000, constants.minute)  # 1969-12-31 23:59:10
-            0  # 1970-01-01 00:00:00
-        """
-        # For positive: (ms + factor - 1) // factor * factor
-        # For negative: use mathematical ceiling
-        if milliseconds >= 0:
-            return ((milliseconds + factor - 1) // factor) * factor
-        else:
-            # For negative numbers, floor division already rounds down (more negative)
-            # So we use: if divisible, keep it; otherwise add one factor to floor result
-            floored = (milliseconds // factor) * factor
-            return floored if milliseconds == floored else floored + factor
 
-    @staticmethod
-    def last_second(timestamp: int) -> int:
-        """
-        Get the start of the previous second.
+def next_second(timestamp: int) -> int:
+    """
+    Get the start of the next second.
 
-        Args:
-            timestamp: Timestamp in milliseconds
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Returns:
-            Timestamp of the previous second boundary
+    Returns:
+        Timestamp of the next second boundary
 
-        Example:
-            >>> milliseconds.last_second(1704110455500)  # 12:00:55.500
-            1704110454000  # 12:00:54.000
-            >>> milliseconds.last_second(500)  # 1970-01-01 00:00:00.500
-            0  # 1970-01-01 00:00:00.000
-            >>> milliseconds.last_second(0)  # 1970-01-01 00:00:00.000
-            -1000  # 1969-12-31 23:59:59.000
-        """
-        return milliseconds.floor(timestamp, constants.second) - constants.second
+    Example:
+        >>> milliseconds.next_second(1704110455500)  # 12:00:55.500
+        1704110456000  # 12:00:56.000
+    """
+    return timestamp - timestamp % SECOND + SECOND
 
-    @staticmethod
-    def next_second(timestamp: int) -> int:
-        """
-        Get the start of the next second.
 
-        Args:
-            timestamp: Timestamp in milliseconds
+def last_minute(timestamp: int) -> int:
+    """
+    Get the start of the previous minute.
 
-        Returns:
-            Timestamp of the next second boundary
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Example:
-            >>> milliseconds.next_second(1704110455500)  # 12:00:55.500
-            1704110456000  # 12:00:56.000
-        """
-        return milliseconds.floor(timestamp, constants.second) + constants.second
+    Returns:
+        Timestamp of the previous minute boundary
 
-    @staticmethod
-    def last_minute(timestamp: int) -> int:
-        """
-        Get the start of the previous minute.
+    Example:
+        >>> milliseconds.last_minute(1704110455000)  # 12:00:55
+        1704110400000  # 11:59:00
+        >>> milliseconds.last_minute(30000)  # 1970-01-01 00:00:30
+        -60000  # 1969-12-31 23:59:00
+    """
+    return timestamp - timestamp % MINUTE - MINUTE
 
-        Args:
-            timestamp: Timestamp in milliseconds
 
-        Returns:
-            Timestamp of the previous minute boundary
+def next_minute(timestamp: int) -> int:
+    """
+    Get the start of the next minute.
 
-        Example:
-            >>> milliseconds.last_minute(1704110455000)  # 12:00:55
-            1704110400000  # 11:59:00
-            >>> milliseconds.last_minute(30000)  # 1970-01-01 00:00:30
-            -60000  # 1969-12-31 23:59:00
-        """
-        return milliseconds.floor(timestamp, constants.minute) - constants.minute
+    Args:
+        timestamp: Timestamp in milliseconds
 
-    @staticmethod
-    def next_minute(timestamp: int) -> int:
-        """
-        Get the start of the next minute.
+    Returns:
+        Timestamp of the next minute boundary
 
-        Args:
-            timestamp: Timestamp in milliseconds
+    Example:
+        >>> milliseconds.next_minute(1704110455000)  # 12:00:55
+        1704110520000  # 12:01:00
+    """
+    return timestamp - timestamp % MINUTE + MINUTE
 
-        Returns:
-            Timestamp of the next minute boundary
 
-        Example:
-            >>> milliseconds.next_minute(1704110455000)  # 12:00:55
-            1704110520000  # 12:01:00
-        """
-        return milliseconds.floor(timestamp, constants.minute) + constants.minute
+def last_hour(timestamp: int) -> int:
+    """
+    Get the start of the previous hour.
 
-    @staticmethod
-    def last_hour(timestamp: int) -> int:
-        """
-        Get the start of the previous hour.
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Args:
-            timestamp: Timestamp in milliseconds
+    Returns:
+        Timestamp of the previous hour boundary
 
-        Returns:
-            Timestamp of the previous hour boundary
+    Example:
+        >>> milliseconds.last_hour(1704110455000)  # 12:00:55
+        1704106800000  # 11:00:00
+        >>> milliseconds.last_hour(1800000)  # 1970-01-01 00:30:00
+        -3600000  # 1969-12-31 23:00:00
+    """
+    return timestamp - timestamp % HOUR - HOUR
 
-        Example:
-            >>> milliseconds.last_hour(1704110455000)  # 12:00:55
-            1704106800000  # 11:00:00
-            >>> milliseconds.last_hour(1800000)  # 1970-01-01 00:30:00
-            -3600000  # 1969-12-31 23:00:00
-        """
-        return milliseconds.floor(timestamp, constants.hour) - constants.hour
 
-    @staticmethod
-    def next_hour(timestamp: int) -> int:
-        """
-        Get the start of the next hour.
+def next_hour(timestamp: int) -> int:
+    """
+    Get the start of the next hour.
 
-        Args:
-            timestamp: Timestamp in milliseconds
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Returns:
-            Timestamp of the next hour boundary
+    Returns:
+        Timestamp of the next hour boundary
 
-        Example:
-            >>> milliseconds.next_hour(1704110455000)  # 12:00:55
-            1704114000000  # 13:00:00
-        """
-        return milliseconds.floor(timestamp, constants.hour) + constants.hour
+    Example:
+        >>> milliseconds.next_hour(1704110455000)  # 12:00:55
+        1704114000000  # 13:00:00
+    """
+    return timestamp - timestamp % HOUR + HOUR
 
-    @staticmethod
-    def last_day(timestamp: int) -> int:
-        """
-        Get the start of the previous day (UTC).
 
-        Note: This operates on UTC day boundaries. For timezone-aware day
-        boundaries, convert the timestamp to the target timezone first.
+def last_day(timestamp: int) -> int:
+    """
+    Get the start of the previous day (UTC).
 
-        Args:
-            timestamp: Timestamp in milliseconds
+    Note: This operates on UTC day boundaries. For timezone-aware day
+    boundaries, convert the timestamp to the target timezone first.
 
-        Returns:
-            Timestamp of the previous day boundary
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Example:
-            >>> milliseconds.last_day(1704110455000)  # 2024-01-01 12:00:55 UTC
-            1704067200000  # 2023-12-31 00:00:00 UTC
-            >>> milliseconds.last_day(43200000)  # 1970-01-01 12:00:00 UTC
-            -86400000  # 1969-12-31 00:00:00 UTC
-        """
-        return milliseconds.floor(timestamp, constants.day) - constants.day
+    Returns:
+        Timestamp of the previous day boundary
 
-    @staticmethod
-    def next_day(timestamp: int) -> int:
-        """
-        Get the start of the next day (UTC).
+    Example:
+        >>> milliseconds.last_day(1704110455000)  # 2024-01-01 12:00:55 UTC
+        1704067200000  # 2023-12-31 00:00:00 UTC
+        >>> milliseconds.last_day(43200000)  # 1970-01-01 12:00:00 UTC
+        -86400000  # 1969-12-31 00:00:00 UTC
+    """
+    return timestamp - timestamp % DAY - DAY
 
-        Note: This operates on UTC day boundaries. For timezone-aware day
-        boundaries, convert the timestamp to the target timezone first.
 
-        Args:
-            timestamp: Timestamp in milliseconds
+def next_day(timestamp: int) -> int:
+    """
+    Get the start of the next day (UTC).
 
-        Returns:
-            Timestamp of the next day boundary
+    Note: This operates on UTC day boundaries. For timezone-aware day
+    boundaries, convert the timestamp to the target timezone first.
 
-        Example:
-            >>> milliseconds.next_day(1704110455000)  # 2024-01-01 12:00:55 UTC
-            1704153600000  # 2024-01-02 00:00:00 UTC
-        """
-        return milliseconds.floor(timestamp, constants.day) + constants.day
+    Args:
+        timestamp: Timestamp in milliseconds
 
-    @staticmethod
-    def is_valid_second(timestamp: int) -> bool:
-        """
-        Check if timestamp is aligned to a second boundary.
+    Returns:
+        Timestamp of the next day boundary
 
-        Args:
-            timestamp: Timestamp in milliseconds
+    Example:
+        >>> milliseconds.next_day(1704110455000)  # 2024-01-01 12:00:55 UTC
+        1704153600000  # 2024-01-02 00:00:00 UTC
+    """
+    return timestamp - timestamp % DAY + DAY
 
-        Returns:
-            True if timestamp has no millisecond component
 
-        Example:
-            >>> milliseconds.is_valid_second(1704110455000)
-            True
-            >>> milliseconds.is_valid_second(1704110455500)
-            False
-        """
-        return timestamp % constants.second == 0
+def is_valid_second(timestamp: int) -> bool:
+    """
+    Check if timestamp is aligned to a second boundary.
 
-    @staticmethod
-    def is_valid_minute(timestamp: int) -> bool:
-        """
-        Check if timestamp is aligned to a minute boundary.
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Args:
-            timestamp: Timestamp in milliseconds
+    Returns:
+        True if timestamp has no millisecond component
 
-        Returns:
-            True if timestamp has no second or millisecond component
+    Example:
+        >>> milliseconds.is_valid_second(1704110455000)
+        True
+        >>> milliseconds.is_valid_second(1704110455500)
+        False
+    """
+    return timestamp % SECOND == 0
 
-        Example:
-            >>> milliseconds.is_valid_minute(1704110400000)
-            True
-            >>> milliseconds.is_valid_minute(1704110455000)
-            False
-        """
-        return timestamp % constants.minute == 0
 
-    @staticmethod
-    def is_valid_hour(timestamp: int) -> bool:
-        """
-        Check if timestamp is aligned to an hour boundary.
+def is_valid_minute(timestamp: int) -> bool:
+    """
+    Check if timestamp is aligned to a minute boundary.
 
-        Args:
-            timestamp: Timestamp in milliseconds
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Returns:
-            True if timestamp has no minute, second, or millisecond component
+    Returns:
+        True if timestamp has no second or millisecond component
 
-        Example:
-            >>> milliseconds.is_valid_hour(1704110400000)
-            True
-            >>> milliseconds.is_valid_hour(1704110455000)
-            False
-        """
-        return timestamp % constants.hour == 0
+    Example:
+        >>> milliseconds.is_valid_minute(1704110400000)
+        True
+        >>> milliseconds.is_valid_minute(1704110455000)
+        False
+    """
+    return timestamp % MINUTE == 0
 
-    @staticmethod
-    def is_valid_day(timestamp: int) -> bool:
-        """
-        Check if timestamp is aligned to a day boundary (UTC).
 
-        Args:
-            timestamp: Timestamp in milliseconds
+def is_valid_hour(timestamp: int) -> bool:
+    """
+    Check if timestamp is aligned to an hour boundary.
 
-        Returns:
-            True if timestamp represents midnight UTC
+    Args:
+        timestamp: Timestamp in milliseconds
 
-        Example:
-            >>> milliseconds.is_valid_day(1704067200000)  # 2024-01-01 00:00:00 UTC
-            True
-            >>> milliseconds.is_valid_day(1704110455000)  # 2024-01-01 12:00:55 UTC
-            False
-        """
-        return timestamp % constants.day == 0
+    Returns:
+        True if timestamp has no minute, second, or millisecond component
 
-    @staticmethod
-    def increment_second(timestamp: int, n: float = 1) -> int:
-        """
-        Add seconds to a timestamp.
+    Example:
+        >>> milliseconds.is_valid_hour(1704110400000)
+        True
+        >>> milliseconds.is_valid_hour(1704110455000)
+        False
+    """
+    return timestamp % HOUR == 0
 
-        Args:
-            timestamp: Timestamp in milliseconds
-            n: Number of seconds to add (can be fractional)
 
-        Returns:
-            New timestamp in milliseconds
+def is_valid_day(timestamp: int) -> bool:
+    """
+    Check if timestamp is aligned to a day boundary (UTC).
 
-        Example:
-            >>> milliseconds.increment_second(1704110455000, 5)
-            1704110460000
-            >>> milliseconds.increment_second(1704110455000, 0.5)
-            1704110455500
-        """
-        return timestamp + int(constants.second * n)
+    Args:
+        timestamp: Timestamp in milliseconds
 
-    @staticmethod
-    def decrement_second(timestamp: int, n: float = 1) -> int:
-        """
-        Subtract seconds from a timestamp.
+    Returns:
+        True if timestamp represents midnight UTC
 
-        Args:
-            timestamp: Timestamp in milliseconds
-            n: Number of seconds to subtract (can be fractional)
+    Example:
+        >>> milliseconds.is_valid_day(1704067200000)  # 2024-01-01 00:00:00 UTC
+        True
+        >>> milliseconds.is_valid_day(1704110455000)  # 2024-01-01 12:00:55 UTC
+        False
+    """
+    return timestamp % DAY == 0
 
-        Returns:
-            New timestamp in milliseconds
 
-        Example:
-            >>> milliseconds.decrement_second(1704110455000, 5)
-            1704110450000
-            >>> milliseconds.decrement_second(500, 1)  # 1970-01-01 00:00:00.500
-            -500  # 1969-12-31 23:59:59.500
-        """
-        return timestamp - int(constants.second * n)
+# The increment_*/decrement_* helpers annotate n as Union[int, float] rather than
+# float, hence the noqa: mypyc unboxes a float argument to a C double, which would
+# turn int counts into floats before the int fast path.
+def increment_second(
+    timestamp: int, n: Union[int, float] = 1  # noqa: FA100, PYI041
+) -> int:
+    """
+    Add seconds to a timestamp.
 
-    @staticmethod
-    def increment_minute(timestamp: int, n: float = 1) -> int:
-        """
-        Add minutes to a timestamp.
+    Args:
+        timestamp: Timestamp in milliseconds
+        n: Number of seconds to add (can be fractional)
 
-        Args:
-            timestamp: Timestamp in milliseconds
-            n: Number of minutes to add (can be fractional)
+    Returns:
+        New timestamp in milliseconds
 
-        Returns:
-            New timestamp in milliseconds
+    Example:
+        >>> milliseconds.increment_second(1704110455000, 5)
+        1704110460000
+        >>> milliseconds.increment_second(1704110455000, 0.5)
+        1704110455500
+    """
+    if type(n) is int:
+        return timestamp + SECOND * n
+    return timestamp + int(SECOND * n)
 
-        Example:
-            >>> milliseconds.increment_minute(1704110400000, 30)
-            1704112200000
-        """
-        return timestamp + int(constants.minute * n)
 
-    @staticmethod
-    def decrement_minute(timestamp: int, n: float = 1) -> int:
-        """
-        Subtract minutes from a timestamp.
+def decrement_second(
+    timestamp: int, n: Union[int, float] = 1  # noqa: FA100, PYI041
+) -> int:
+    """
+    Subtract seconds from a timestamp.
 
-        Args:
-            timestamp: Timestamp in milliseconds
-            n: Number of minutes to subtract (can be fractional)
+    Args:
+        timestamp: Timestamp in milliseconds
+        n: Number of seconds to subtract (can be fractional)
 
-        Returns:
-            New timestamp in milliseconds
+    Returns:
+        New timestamp in milliseconds
 
-        Example:
-            >>> milliseconds.decrement_minute(1704110400000, 10)
-            1704109800000
-            >>> milliseconds.decrement_minute(30000, 1)  # 1970-01-01 00:00:30
-            -30000  # 1969-12-31 23:59:30
-        """
-        return timestamp - int(constants.minute * n)
+    Example:
+        >>> milliseconds.decrement_second(1704110455000, 5)
+        1704110450000
+        >>> milliseconds.decrement_second(500, 1)  # 1970-01-01 00:00:00.500
+        -500  # 1969-12-31 23:59:59.500
+    """
+    if type(n) is int:
+        return timestamp - SECOND * n
+    return timestamp - int(SECOND * n)
 
-    @staticmethod
-    def increment_hour(timestamp: int, n: float = 1) -> int:
-        """
-        Add hours to a timestamp.
 
-        Args:
-            timestamp: Timestamp in milliseconds
-            n: Number of hours to add (can be fractional)
+def increment_minute(
+    timestamp: int, n: Union[int, float] = 1  # noqa: FA100, PYI041
+) -> int:
+    """
+    Add minutes to a timestamp.
 
-        Returns:
-            New timestamp in milliseconds
+    Args:
+        timestamp: Timestamp in milliseconds
+        n: Number of minutes to add (can be fractional)
 
-        Example:
-            >>> milliseconds.increment_hour(1704110400000, 2)
-            1704117600000
-        """
-        return timestamp + int(constants.hour * n)
+    Returns:
+        New timestamp in milliseconds
 
-    @staticmethod
-    def decrement_hour(timestamp: int, n: float = 1) -> int:
-        """
-        Subtract hours from a timestamp.
+    Example:
+        >>> milliseconds.increment_minute(1704110400000, 30)
+        1704112200000
+    """
+    if type(n) is int:
+        return timestamp + MINUTE * n
+    return timestamp + int(MINUTE * n)
 
-        Args:
-            timestamp: Timestamp in milliseconds
-            n: Number of hours to subtract (can be fractional)
 
-        Returns:
-            New timestamp in milliseconds
+def decrement_minute(
+    timestamp: int, n: Union[int, float] = 1  # noqa: FA100, PYI041
+) -> int:
+    """
+    Subtract minutes from a timestamp.
 
-        Example:
-            >>> milliseconds.decrement_hour(1704110400000, 3)
-            1704099600000
-            >>> milliseconds.decrement_hour(1800000, 1)  # 1970-01-01 00:30:00
-            -1800000  # 1969-12-31 23:30:00
-        """
-        return timestamp - int(constants.hour * n)
+    Args:
+        timestamp: Timestamp in milliseconds
+        n: Number of minutes to subtract (can be fractional)
 
-    @staticmethod
-    def increment_day(timestamp: int, n: float = 1) -> int:
-        """
-        Add days to a timestamp.
+    Returns:
+        New timestamp in milliseconds
 
-        Args:
-            timestamp: Timestamp in milliseconds
-            n: Number of days to add (can be fractional)
+    Example:
+        >>> milliseconds.decrement_minute(1704110400000, 10)
+        1704109800000
+        >>> milliseconds.decrement_minute(30000, 1)  # 1970-01-01 00:00:30
+        -30000  # 1969-12-31 23:59:30
+    """
+    if type(n) is int:
+        return timestamp - MINUTE * n
+    return timestamp - int(MINUTE * n)
 
-        Returns:
-            New timestamp in milliseconds
 
-        Example:
-            >>> milliseconds.increment_day(1704067200000, 1)
-            1704153600000
-        """
-        return timestamp + int(constants.day * n)
+def increment_hour(
+    timestamp: int, n: Union[int, float] = 1  # noqa: FA100, PYI041
+) -> int:
+    """
+    Add hours to a timestamp.
 
-    @staticmethod
-    def decrement_day(timestamp: int, n: float = 1) -> int:
-        """
-        Subtract days from a timestamp.
+    Args:
+        timestamp: Timestamp in milliseconds
+        n: Number of hours to add (can be fractional)
 
-        Args:
-            timestamp: Timestamp in milliseconds
-            n: Number of days to subtract (can be fractional)
+    Returns:
+        New timestamp in milliseconds
 
-        Returns:
-            New timestamp in milliseconds
+    Example:
+        >>> milliseconds.increment_hour(1704110400000, 2)
+        1704117600000
+    """
+    if type(n) is int:
+        return timestamp + HOUR * n
+    return timestamp + int(HOUR * n)
 
-        Example:
-            >>> milliseconds.decrement_day(1704067200000, 1)
-            1703980800000
-            >>> milliseconds.decrement_day(43200000, 1)  # 1970-01-01 12:00:00
-            -43200000  # 1969-12-31 12:00:00
-        """
-        return timestamp - int(constants.day * n)
 
-    @staticmethod
-    def is_same_second(ts1: int, ts2: int) -> bool:
-        """
-        Check if two timestamps fall within the same second.
+def decrement_hour(
+    timestamp: int, n: Union[int, float] = 1  # noqa: FA100, PYI041
+) -> int:
+    """
+    Subtract hours from a timestamp.
 
-        Args:
-            ts1: First timestamp in milliseconds
-            ts2: Second timestamp in milliseconds
+    Args:
+        timestamp: Timestamp in milliseconds
+        n: Number of hours to subtract (can be fractional)
 
-        Returns:
-            True if both timestamps are in the same second
+    Returns:
+        New timestamp in milliseconds
 
-        Example:
-            >>> milliseconds.is_same_second(1704110455100, 1704110455900)
-            True
-            >>> milliseconds.is_same_second(1704110455900, 1704110456100)
-            False
-        """
-        return milliseconds.floor(ts1, constants.second) == milliseconds.floor(
-            ts2, constants.second
-        )
+    Example:
+        >>> milliseconds.decrement_hour(1704110400000, 3)
+        1704099600000
+        >>> milliseconds.decrement_hour(1800000, 1)  # 1970-01-01 00:30:00
+        -1800000  # 1969-12-31 23:30:00
+    """
+    if type(n) is int:
+        return timestamp - HOUR * n
+    return timestamp - int(HOUR * n)
 
-    @staticmethod
-    def is_same_minute(ts1: int, ts2: int) -> bool:
-        """
-        Check if two timestamps fall within the same minute.
 
-        Args:
-            ts1: First timestamp in milliseconds
-            ts2: Second timestamp in milliseconds
+def increment_day(
+    timestamp: int, n: Union[int, float] = 1  # noqa: FA100, PYI041
+) -> int:
+    """
+    Add days to a timestamp.
 
-        Returns:
-            True if both timestamps are in the same minute
+    Args:
+        timestamp: Timestamp in milliseconds
+        n: Number of days to add (can be fractional)
 
-        Example:
-            >>> milliseconds.is_same_minute(1704110400000, 1704110459000)
-            True
-            >>> milliseconds.is_same_minute(1704110459000, 1704110460000)
-            False
-        """
-        return milliseconds.floor(ts1, constants.minute) == milliseconds.floor(
-            ts2, constants.minute
-        )
+    Returns:
+        New timestamp in milliseconds
 
-    @staticmethod
-    def is_same_hour(ts1: int, ts2: int) -> bool:
-        """
-        Check if two timestamps fall within the same hour.
+    Example:
+        >>> milliseconds.increment_day(1704067200000, 1)
+        1704153600000
+    """
+    if type(n) is int:
+        return timestamp + DAY * n
+    return timestamp + int(DAY * n)
 
-        Args:
-            ts1: First timestamp in milliseconds
-            ts2: Second timestamp in milliseconds
 
-        Returns:
-            True if both timestamps are in the same hour
+def decrement_day(
+    timestamp: int, n: Union[int, float] = 1  # noqa: FA100, PYI041
+) -> int:
+    """
+    Subtract days from a timestamp.
 
-        Example:
-            >>> milliseconds.is_same_hour(1704110400000, 1704113999000)
-            True
-            >>> milliseconds.is_same_hour(1704113999000, 1704114000000)
-            False
-        """
-        return milliseconds.floor(ts1, constants.hour) == milliseconds.floor(
-            ts2, constants.hour
-        )
+    Args:
+        timestamp: Timestamp in milliseconds
+        n: Number of days to subtract (can be fractional)
+
+    Returns:
+        New timestamp in milliseconds
+
+    Example:
+        >>> milliseconds.decrement_day(1704067200000, 1)
+        1703980800000
+        >>> milliseconds.decrement_day(43200000, 1)  # 1970-01-01 12:00:00
+        -43200000  # 1969-12-31 12:00:00
+    """
+    if type(n) is int:
+        return timestamp - DAY * n
+    return timestamp - int(DAY * n)
+
+
+def is_same_second(ts1: int, ts2: int) -> bool:
+    """
+    Check if two timestamps fall within the same second.
+
+    Args:
+        ts1: First timestamp in milliseconds
+        ts2: Second timestamp in milliseconds
+
+    Returns:
+        True if both timestamps are in the same second
+
+    Example:
+        >>> milliseconds.is_same_second(1704110455100, 1704110455900)
+        True
+        >>> milliseconds.is_same_second(1704110455900, 1704110456100)
+        False
+    """
+    return ts1 // SECOND == ts2 // SECOND
+
+
+def is_same_minute(ts1: int, ts2: int) -> bool:
+    """
+    Check if two timestamps fall within the same minute.
+
+    Args:
+        ts1: First timestamp in milliseconds
+        ts2: Second timestamp in milliseconds
 
+    Returns:
+        True if both timestamps are in the same minute
+
+    Example:
+        >>> milliseconds.is_same_minute(1704110400000, 1704110459000)
+        True
+        >>> milliseconds.is_same_minute(1704110459000, 1704110460000)
+        False
+    """
+    return ts1 // MINUTE == ts2 // MINUTE
+
+
+def is_same_hour(ts1: int, ts2: int) -> bool:
+    """
+    Check if two timestamps fall within the same hour.
+
+    Args:
+        ts1: First timestamp in milliseconds
+        ts2: Second timestamp in milliseconds
+
+    Returns:
+        True if both timestamps are in the same hour
+
+    Example:
+        >>> milliseconds.is_same_hour(1704110400000, 1704113999000)
+        True
+        >>> milliseconds.is_same_hour(1704113999000, 1704114000000)
+        False
+    """
+    return ts1 // HOUR == ts2 // HOUR
+
+
+def is_same_day(ts1: int, ts2: int) -> bool:
+    """
+    Check if two timestamps fall within the same day (UTC).
+
+    Note: This compares UTC day boundaries. For timezone-aware comparisons,
+    convert timestamps to the target timezone before comparison.
+
+    Args:
+        ts1: First timestamp in milliseconds
+        ts2: Second timestamp in milliseconds
+
+    Returns:
+        True if both timestamps are on the same UTC day
+
+    Example:
+        >>> milliseconds.is_same_day(1704067200000, 1704153599000)
+        True
+        >>> milliseconds.is_same_day(1704153599000, 1704153600000)
+        False
+    """
+    return ts1 // DAY == ts2 // DAY
+
+
+class milliseconds:
+    """
+    A utility class for working with POSIX timestamps in milliseconds.
+
+    All methods are static and operate on integer timestamps representing
+    milliseconds since the Unix epoch (1970-01-01 00:00:00 UTC). Apart from the
+    milliseconds() conversion, they are the module-level functions of the same
+    name; calling those directly skips the class attribute lookup, which is
+    measurable in tight loops.
+    """
+
+    # Defined here rather than at module level, where the name belongs to the class.
     @staticmethod
-    def is_same_day(ts1: int, ts2: int) -> bool:
+    def milliseconds(time: datetime) -> int:
         """
-        Check if two timestamps fall within the same day (UTC).
+        Convert a datetime object to milliseconds since Unix epoch.
 
-        Note: This compares UTC day boundaries. For timezone-aware comparisons,
-        convert timestamps to the target timezone before comparison.
+        Timezone-aware datetimes are converted with exact integer arithmetic.
+        Naive datetimes are interpreted as local time, like datetime.timestamp().
+        In both cases sub-millisecond precision is rounded down.
 
         Args:
-            ts1: First timestamp in milliseconds
-            ts2: Second timestamp in milliseconds
+            time: A datetime object (timezone-aware or naive)
 
         Returns:
-            True if both timestamps are on the same UTC day
+            Integer milliseconds since Unix epoch
 
         Example:
-            >>> milliseconds.is_same_day(1704067200000, 1704153599000)
-            True
-            >>> milliseconds.is_same_day(1704153599000, 1704153600000)
-            False
+            >>> dt = datetime(2024, 1, 1, 12, 0, 0, tzinfo=ZoneInfo("UTC"))
+            >>> milliseconds.milliseconds(dt)
+            1704110400000
         """
-        return milliseconds.floor(ts1, constants.day) == milliseconds.floor(
-            ts2, constants.day
-        )
+        if time.tzinfo is None:
+            # timestamp() is a float that cannot resolve microseconds far from the
+            # epoch. Take only whole seconds from it and the milliseconds from the
+            # microsecond field, so naive datetimes agree with the exact aware path.
+            microsecond = time.microsecond
+            seconds = round(time.timestamp() - microsecond / 1_000_000)
+            return seconds * SECOND + microsecond // 1000
+        delta = time - _EPOCH_UTC
+        return delta.days * DAY + delta.seconds * SECOND + delta.microseconds // 1000
+
+    # ClassVar keeps these in the class dict when compiled with mypyc, which
+    # would otherwise turn them into instance attributes of a native class.
+
+    time: ClassVar = staticmethod(time)
+    floor: ClassVar = staticmethod(floor)
+    ceil: ClassVar = staticmethod(ceil)
+    last_second: ClassVar = staticmethod(last_second)
+    next_second: ClassVar = staticmethod(next_second)
+    last_minute: ClassVar = staticmethod(last_minute)
+    next_minute: ClassVar = staticmethod(next_minute)
+    last_hour: ClassVar = staticmethod(last_hour)
+    next_hour: ClassVar = staticmethod(next_hour)
+    last_day: ClassVar = staticmethod(last_day)
+    next_day: ClassVar = staticmethod(next_day)
+    is_valid_second: ClassVar = staticmethod(is_valid_second)
+    is_valid_minute: ClassVar = staticmethod(is_valid_minute)
+    is_valid_hour: ClassVar = staticmethod(is_valid_hour)
+    is_valid_day: ClassVar = staticmethod(is_valid_day)
+    increment_second: ClassVar = staticmethod(increment_second)
+    decrement_second: ClassVar = staticmethod(decrement_second)
+    increment_minute: ClassVar = staticmethod(increment_minute)
+    decrement_minute: ClassVar = staticmethod(decrement_minute)
+    increment_hour: ClassVar = staticmethod(increment_hour)
+    decrement_hour: ClassVar = staticmethod(decrement_hour)
+    increment_day: ClassVar = staticmethod(increment_day)
+    decrement_day: ClassVar = staticmethod(decrement_day)
+    is_same_second: ClassVar = staticmethod(is_same_second)
+    is_same_minute: ClassVar = staticmethod(is_same_minute)
+    is_same_hour: ClassVar = staticmethod(is_same_hour)
+    is_same_day: ClassVar = staticmethod(is_same_day)
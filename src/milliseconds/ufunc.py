@@ -0,0 +1,46 @@
+"""
+Numba-compiled NumPy ufuncs for timestamps in milliseconds.
+
+This module provides true NumPy ufuncs built with numba.vectorize. They run as
+a single compiled loop that releases the GIL and is split across threads, so on
+large arrays they scale with the number of cores where the milliseconds.batch
+functions run on one.
+
+Numba is an optional dependency and is only required by this module:
+    pip install milliseconds[numba]
+
+The kernels are compiled on first import and cached on disk afterwards. For
+small arrays the thread start-up cost outweighs the gain; prefer
+milliseconds.batch there.
+
+numba.vectorize builds the ufunc's __doc__ from its call signature, so the
+functions are documented here rather than in their own docstrings.
+
+floor_ufunc(timestamp, factor)
+    Round down timestamps to the nearest multiple of a time factor, element-wise.
+
+    Negative timestamps (dates before Unix epoch) are handled the same way as
+    milliseconds.floor, rounding toward negative infinity.
+
+    A factor of 0 is not rejected: the compiled loop cannot raise, and the
+    timestamp is returned unchanged. milliseconds.floor raises
+    ZeroDivisionError and floor_batch warns in that case.
+
+    Args:
+        timestamp: Array of timestamps in milliseconds (int64)
+        factor: Time unit to floor to, as a scalar or broadcastable array
+
+    Returns:
+        New int64 array of floored timestamps in milliseconds
+
+    Example:
+        >>> floor_ufunc(np.array([1704110455000, -50000]), constants.minute)
+        array([1704110400000,        -60000])
+"""
+
+from numba import int64, vectorize
+
+
+@vectorize([int64(int64, int64)], target="parallel", cache=True)
+def floor_ufunc(timestamp, factor):
+    return timestamp - timestamp % factor
@@ -0,0 +1,163 @@
+"""
+Unit tests for the milliseconds.batch module.
+
+Run with: pytest tests/test_batch.py
+Or with hatch: hatch run test
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from milliseconds import UTC, constants, milliseconds
+
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("milliseconds.batch")
+
+TIMESTAMPS = [
+    1704112496789,  # 2024-01-01 12:34:56.789
+    1704110400000,  # 2024-01-01 12:00:00
+    1704067200000,  # 2024-01-01 00:00:00
+    0,
+    -50000,  # 1969-12-31 23:59:10
+    -3600000,  # 1969-12-31 23:00:00
+    -2208988800000,  # 1900-01-01 00:00:00
+]
+
+
+class TestFloorBatch:
+    """Test vectorized floor."""
+
+    def test_floor_batch_matches_scalar(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        for factor in constants:
+            result = batch.floor_batch(ts, factor)
+            expected = [milliseconds.floor(t, factor) for t in TIMESTAMPS]
+            assert result.tolist() == expected
+
+    def test_floor_batch_default_factor(self):
+        result = batch.floor_batch(np.array([1704112496789]))
+        assert result.tolist() == [1704110400000]
+
+    def test_floor_batch_returns_int64(self):
+        result = batch.floor_batch([1704112496789, -50000], constants.minute)
+        assert result.dtype == np.int64
+        assert result.tolist() == [1704112440000, -60000]
+
+    def test_floor_batch_does_not_modify_input(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        batch.floor_batch(ts, constants.day)
+        assert ts.tolist() == TIMESTAMPS
+
+
+class TestCeilBatch:
+    """Test vectorized ceil."""
+
+    def test_ceil_batch_matches_scalar(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        for factor in constants:
+            result = batch.ceil_batch(ts, factor)
+            expected = [milliseconds.ceil(t, factor) for t in TIMESTAMPS]
+            assert result.tolist() == expected
+
+    def test_ceil_batch_does_not_modify_input(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        batch.ceil_batch(ts, constants.day)
+        assert ts.tolist() == TIMESTAMPS
+
+
+class TestTimeBatch:
+    """Test vectorized conversion to datetime64."""
+
+    def test_time_batch(self):
+        result = batch.time_batch(np.array([1704110400500, -3600000]))
+        assert result.dtype == np.dtype("datetime64[ms]")
+        assert result.tolist() == [
+            datetime(2024, 1, 1, 12, 0, 0, 500000),
+            datetime(1969, 12, 31, 23, 0, 0),
+        ]
+
+    def test_time_batch_matches_scalar_utc(self):
+        result = batch.time_batch(np.array(TIMESTAMPS, dtype=np.int64))
+        expected = [
+            milliseconds.time(t, ZoneInfo("UTC")).replace(tzinfo=None)
+            for t in TIMESTAMPS
+        ]
+        assert result.tolist() == expected
+
+
+class TestMillisecondsBatch:
+    """Test vectorized conversion from datetime64."""
+
+    def test_milliseconds_batch_roundtrip(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        result = batch.milliseconds_batch(batch.time_batch(ts))
+        assert result.dtype == np.int64
+        assert result.tolist() == TIMESTAMPS
+
+    def test_milliseconds_batch_matches_scalar_utc(self):
+        result = batch.milliseconds_batch(
+            np.array(["2024-01-01T12:00:00.500", "1969-12-31T23:00"], "datetime64")
+        )
+        expected = [
+            milliseconds.milliseconds(datetime(2024, 1, 1, 12, 0, 0, 500000, UTC)),
+            milliseconds.milliseconds(datetime(1969, 12, 31, 23, 0, 0, 0, UTC)),
+        ]
+        assert result.tolist() == expected
+
+    def test_milliseconds_batch_floors_finer_units(self):
+        dt = np.array(["1969-12-31T23:59:59.999999", "2024-01-01T12:00:00.5006"])
+        result = batch.milliseconds_batch(dt.astype("datetime64[us]"))
+        assert result.tolist() == [-1, 1704110400500]
+
+    def test_milliseconds_batch_does_not_share_input(self):
+        dt = batch.time_batch(np.array(TIMESTAMPS, dtype=np.int64))
+        result = batch.milliseconds_batch(dt)
+        result[:] = 0
+        assert batch.milliseconds_batch(dt).tolist() == TIMESTAMPS
+
+
+class TestValidationBatch:
+    """Test vectorized is_valid_* methods."""
+
+    def test_is_valid_batch_matches_scalar(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        pairs = [
+            (batch.is_valid_second_batch, milliseconds.is_valid_second),
+            (batch.is_valid_minute_batch, milliseconds.is_valid_minute),
+            (batch.is_valid_hour_batch, milliseconds.is_valid_hour),
+            (batch.is_valid_day_batch, milliseconds.is_valid_day),
+        ]
+        for vectorized, scalar in pairs:
+            assert vectorized(ts).tolist() == [scalar(t) for t in TIMESTAMPS]
+
+
+class TestComparisonBatch:
+    """Test vectorized is_same_* methods."""
+
+    def test_is_same_batch_matches_scalar(self):
+        ts1 = np.array(TIMESTAMPS, dtype=np.int64)
+        ts2 = ts1 + 999
+        pairs = [
+            (batch.is_same_second_batch, milliseconds.is_same_second),
+            (batch.is_same_minute_batch, milliseconds.is_same_minute),
+            (batch.is_same_hour_batch, milliseconds.is_same_hour),
+            (batch.is_same_day_batch, milliseconds.is_same_day),
+        ]
+        for vectorized, scalar in pairs:
+            expected = [scalar(a, b) for a, b in zip(ts1.tolist(), ts2.tolist())]
+            assert vectorized(ts1, ts2).tolist() == expected
+
+    def test_is_same_day_batch(self):
+        ts1 = np.array([1704067200000, 1704153599000])
+        ts2 = np.array([1704153599000, 1704153600000])
+        assert batch.is_same_day_batch(ts1, ts2).tolist() == [True, False]
+
+    def test_is_same_day_batch_broadcasts_scalar(self):
+        ts = np.array([1704067200000, 1704153599000, 1704153600000])
+        assert batch.is_same_day_batch(ts, 1704067200000).tolist() == [
+            True,
+            True,
+            False,
+        ]
@@ -5,9 +5,12 @@ Run with: pytest tests/test_milliseconds.py
 Or with hatch: hatch run test
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, tzinfo
 from zoneinfo import ZoneInfo
 
+import pytest
+
+import milliseconds as package
 from milliseconds import milliseconds, constants
 
 
@@ -20,6 +23,11 @@ class TestConstants:
         assert constants.hour == 3_600_000
         assert constants.day == 86_400_000
 
+    def test_plain_int_constants(self):
+        units = [package.SECOND, package.MINUTE, package.HOUR, package.DAY]
+        assert units == list(constants)
+        assert all(type(unit) is int for unit in units)
+
 
 class TestConversion:
     """Test datetime to millisecond conversions."""
@@ -34,6 +42,57 @@ class TestConversion:
         result = milliseconds.milliseconds(dt)
         assert result == 1704110400500
 
+    def test_milliseconds_from_datetime_other_timezone(self):
+        dt = datetime(2024, 1, 1, 7, 0, 0, tzinfo=ZoneInfo("America/New_York"))
+        result = milliseconds.milliseconds(dt)
+        assert result == 1704110400000
+
+    def test_milliseconds_from_datetime_negative_sub_millisecond(self):
+        # 1969-12-31 23:59:59.999500 is before the epoch, so it floors to -1
+        dt = datetime(1969, 12, 31, 23, 59, 59, 999500, tzinfo=ZoneInfo("UTC"))
+        result = milliseconds.milliseconds(dt)
+        assert result == -1
+
+    def test_milliseconds_from_datetime_far_future_is_exact(self):
+        dt = datetime(9999, 12, 31, 23, 59, 59, 999000, tzinfo=ZoneInfo("UTC"))
+        result = milliseconds.milliseconds(dt)
+        assert result == 253402300799999
+
+    def test_milliseconds_from_naive_datetime_is_local_time(self):
+        dt = datetime(2024, 1, 1, 12, 0, 0, 500000)
+        result = milliseconds.milliseconds(dt)
+        assert result == milliseconds.milliseconds(dt.astimezone())
+
+    def test_milliseconds_from_naive_datetime_is_exact(self):
+        for dt in [
+            datetime(2024, 1, 1, 12, 0, 0, 123000),
+            datetime(2004, 4, 8, 11, 6, 2, 985000),
+            datetime(1952, 9, 4, 9, 30, 17, 468000),
+            datetime(5000, 6, 10, 14, 25, 13, 469000),
+            datetime(9999, 12, 30, 23, 59, 59, 999000),
+        ]:
+            result = milliseconds.milliseconds(dt)
+            assert result == milliseconds.milliseconds(dt.astimezone())
+            assert result % 1000 == dt.microsecond // 1000
+
+    def test_milliseconds_from_naive_datetime_before_epoch_floors(self):
+        dt = datetime(1969, 12, 31, 23, 59, 59, 999500)
+        result = milliseconds.milliseconds(dt)
+        assert result == milliseconds.milliseconds(dt.astimezone())
+
+    def test_milliseconds_from_datetime_with_broken_tzinfo_raises(self):
+        class IntOffset(tzinfo):
+            def utcoffset(self, dt):
+                return 3600
+
+        class FailingOffset(tzinfo):
+            def utcoffset(self, dt):
+                raise TypeError("bug")
+
+        for tz in (IntOffset(), FailingOffset()):
+            with pytest.raises(TypeError):
+                milliseconds.milliseconds(datetime(2024, 1, 1, 12, 0, 0, tzinfo=tz))
+
     def test_time_to_datetime(self):
         ms = 1704110400000
         result = milliseconds.time(ms, ZoneInfo("UTC"))
@@ -45,6 +104,23 @@ class TestConversion:
         result = milliseconds.time(ms, ZoneInfo("UTC"))
         assert result.microsecond == 500000
 
+    def test_time_to_datetime_defaults_to_utc(self):
+        result = milliseconds.time(1704110400000)
+        assert result.tzinfo is package.UTC
+        assert result == datetime(2024, 1, 1, 12, 0, 0, tzinfo=ZoneInfo("UTC"))
+
+    def test_time_to_datetime_far_future_is_exact(self):
+        ms = 253402300799999
+        result = milliseconds.time(ms, ZoneInfo("UTC"))
+        expected = datetime(9999, 12, 31, 23, 59, 59, 999000, tzinfo=ZoneInfo("UTC"))
+        assert result == expected
+
+    def test_time_to_datetime_far_past_is_exact(self):
+        ms = -30610224000001  # 1000-01-01 00:00:00 minus one millisecond
+        result = milliseconds.time(ms, ZoneInfo("UTC"))
+        expected = datetime(999, 12, 31, 23, 59, 59, 999000, tzinfo=ZoneInfo("UTC"))
+        assert result == expected
+
     def test_conversion_roundtrip(self):
         dt = datetime(2024, 6, 15, 14, 30, 45, 123000, tzinfo=ZoneInfo("UTC"))
         ms = milliseconds.milliseconds(dt)
@@ -85,6 +161,16 @@ class TestFloorCeil:
         result = milliseconds.floor(ms, constants.minute)
         assert result == -60000  # 1969-12-31 23:59:00
 
+    def test_floor_negative_aligned(self):
+        ms = -60000  # 1969-12-31 23:59:00 (already aligned)
+        result = milliseconds.floor(ms, constants.minute)
+        assert result == ms
+
+    def test_floor_custom_factor(self):
+        ms = 1704110455000  # 2024-01-01 12:00:55
+        result = milliseconds.floor(ms, 15 * constants.minute)
+        assert result == 1704110400000  # 2024-01-01 12:00:00
+
     def test_ceil_to_hour(self):
         ms = 1704110455000  # 2024-01-01 12:00:55
         result = milliseconds.ceil(ms, constants.hour)
@@ -105,6 +191,12 @@ class TestFloorCeil:
         result = milliseconds.ceil(ms, constants.minute)
         assert result == -60000
 
+    def test_ceil_matches_floor(self):
+        for ms in range(-7200001, 7200002, 599999):
+            floored = milliseconds.floor(ms, constants.hour)
+            expected = floored if floored == ms else floored + constants.hour
+            assert milliseconds.ceil(ms, constants.hour) == expected
+
 
 class TestLastNext:
     """Test last_* and next_* boundary methods."""
@@ -159,6 +251,19 @@ class TestLastNext:
         result = milliseconds.last_day(ms)
         assert result == -86400000  # 1969-12-31 00:00:00
 
+    def test_last_next_bracket_floor(self):
+        units = [
+            (milliseconds.last_second, milliseconds.next_second, constants.second),
+            (milliseconds.last_minute, milliseconds.next_minute, constants.minute),
+            (milliseconds.last_hour, milliseconds.next_hour, constants.hour),
+            (milliseconds.last_day, milliseconds.next_day, constants.day),
+        ]
+        for last, next_, unit in units:
+            for ms in (-86400001, -1, 0, 1, 1704110455500):
+                floored = milliseconds.floor(ms, unit)
+                assert last(ms) == floored - unit
+                assert next_(ms) == floored + unit
+
 
 class TestValidation:
     """Test is_valid_* alignment checking methods."""
@@ -205,6 +310,10 @@ class TestIncrement:
         result = milliseconds.increment_second(ms, 0.5)
         assert result == 1704110455500
 
+    def test_increment_second_large_int_is_exact(self):
+        result = milliseconds.increment_second(0, 10**16 + 1)
+        assert result == 10**19 + 1000
+
     def test_increment_minute(self):
         ms = 1704110400000
         result = milliseconds.increment_minute(ms, 30)
@@ -313,6 +422,12 @@ class TestComparison:
         ts2 = -1800000  # 1969-12-31 23:30:00
         assert milliseconds.is_same_hour(ts1, ts2) is True
 
+    def test_is_same_across_epoch(self):
+        # -1 is 1969-12-31 23:59:59.999, 0 is 1970-01-01 00:00:00.000
+        assert milliseconds.is_same_second(-1, 0) is False
+        assert milliseconds.is_same_day(-1, 0) is False
+        assert milliseconds.is_same_second(-999, -1) is True
+
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -343,6 +458,16 @@ class TestEdgeCases:
         assert utc_dt.hour == 12
         assert est_dt.hour == 7  # EST is UTC-5
 
+    def test_timezone_conversion_daylight_saving(self):
+        ms = 1718461800000  # 2024-06-15 14:30:00 UTC
+        edt_dt = milliseconds.time(ms, ZoneInfo("America/New_York"))
+
+        # Summer offset, not the January 1970 one
+        assert edt_dt.hour == 10  # EDT is UTC-4
+        assert edt_dt.minute == 30
+        assert edt_dt.utcoffset() == timedelta(hours=-4)
+        assert milliseconds.milliseconds(edt_dt) == ms
+
     def test_fractional_operations(self):
         ms = 1704110400000
         result = milliseconds.increment_second(ms, 1.5)
@@ -350,3 +475,31 @@ class TestEdgeCases:
 
         result = milliseconds.decrement_hour(ms, 0.25)
         assert result == ms - (constants.hour // 4)
+
+
+class TestModuleFunctions:
+    """Test the module-level functions behind the static methods."""
+
+    def test_functions_are_exported(self):
+        for name in package.__all__:
+            if name in (
+                "milliseconds",
+                "constants",
+                "UTC",
+                "SECOND",
+                "MINUTE",
+                "HOUR",
+                "DAY",
+            ):
+                continue
+            assert getattr(package, name) is getattr(milliseconds, name)
+
+    def test_conversion_has_public_name(self):
+        assert milliseconds.milliseconds.__name__ == "milliseconds"
+
+    def test_function_call(self):
+        from milliseconds import floor, is_same_hour, next_day
+
+        assert floor(1704112496789, constants.hour) == 1704110400000
+        assert next_day(1704110455000) == 1704153600000
+        assert is_same_hour(1704110400000, 1704113999000) is True
@@ -0,0 +1,52 @@
+"""
+Unit tests for the milliseconds.ufunc module.
+
+Run with: pytest tests/test_ufunc.py
+Or with hatch: hatch run test
+"""
+
+import pytest
+
+from milliseconds import constants, milliseconds
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+floor_ufunc = pytest.importorskip("milliseconds.ufunc").floor_ufunc
+
+TIMESTAMPS = [
+    1704112496789,  # 2024-01-01 12:34:56.789
+    1704110400000,  # 2024-01-01 12:00:00
+    0,
+    -50000,  # 1969-12-31 23:59:10
+    -2208988800000,  # 1900-01-01 00:00:00
+]
+
+
+class TestFloorUfunc:
+    """Test the compiled floor ufunc."""
+
+    def test_floor_ufunc_is_ufunc(self):
+        assert isinstance(floor_ufunc, np.ufunc)
+
+    def test_floor_ufunc_matches_scalar(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        for factor in constants:
+            result = floor_ufunc(ts, int(factor))
+            expected = [milliseconds.floor(t, factor) for t in TIMESTAMPS]
+            assert result.tolist() == expected
+
+    def test_floor_ufunc_broadcasts_factor(self):
+        ts = np.array([1704112496789, 1704112496789], dtype=np.int64)
+        factors = np.array([constants.minute, constants.day], dtype=np.int64)
+        result = floor_ufunc(ts, factors)
+        assert result.tolist() == [1704112440000, 1704067200000]
+
+    def test_floor_ufunc_out(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        out = np.empty_like(ts)
+        floor_ufunc(ts, constants.hour, out=out)
+        assert out.tolist() == [milliseconds.floor(t) for t in TIMESTAMPS]
+
+    def test_floor_ufunc_zero_factor_returns_input(self):
+        ts = np.array(TIMESTAMPS, dtype=np.int64)
+        assert floor_ufunc(ts, 0).tolist() == TIMESTAMPS